@@ -4,7 +4,7 @@
  * Integrates with the main build process
  */
 
-const { execSync } = require('child_process');
+const { execFileSync } = require('child_process');
 const { existsSync, mkdirSync } = require('fs');
 const { join } = require('path');
 
@@ -21,8 +21,8 @@ function buildTypeScriptExecutor() {
             process.exit(1);
         }
         
-        // Run the build
-        execSync(`node "${buildScript}"`, { 
+        // Run the build (argv form, no shell; reuse the current node binary)
+        execFileSync(process.execPath, [buildScript], { 
             stdio: 'inherit',
             cwd: projectRoot 
         });
@@ -0,0 +1,81 @@
+/**
+ * ConfigLoader tests
+ * Verify that loaded configs are isolated from callers and track file changes
+ */
+
+import {
+    mkdirSync,
+    mkdtempSync,
+    rmSync,
+    symlinkSync,
+    writeFileSync,
+} from "fs";
+import { tmpdir } from "os";
+import { join } from "path";
+import { ConfigLoader } from "../integrations/express/server/utils/ConfigLoader";
+
+describe("ConfigLoader", () => {
+    let dir: string;
+    let configPath: string;
+
+    beforeEach(() => {
+        jest.spyOn(console, "log").mockImplementation(() => {});
+        dir = mkdtempSync(join(tmpdir(), "fortify-config-"));
+        configPath = join(dir, "fortify.config.json");
+        writeFileSync(
+            configPath,
+            JSON.stringify({ logging: { enabled: true, level: "info" } })
+        );
+    });
+
+    afterEach(() => {
+        rmSync(dir, { recursive: true, force: true });
+        jest.restoreAllMocks();
+    });
+
+    it("does not leak caller mutations into later loads", () => {
+        const first = ConfigLoader.loadConfig({ searchPaths: [dir] }) as any;
+        first.logging.level = "debug";
+        first.logging.extra = true;
+
+        const second = ConfigLoader.loadConfig({ searchPaths: [dir] }) as any;
+        expect(second).not.toBe(first);
+        expect(second.logging).toEqual({ enabled: true, level: "info" });
+    });
+
+    it("skips missing search paths and finds the config in a later one", () => {
+        const config = ConfigLoader.loadConfig({
+            searchPaths: [join(dir, "missing"), dir],
+        }) as any;
+        expect(config.logging.level).toBe("info");
+    });
+
+    it("silently skips a dangling config symlink", () => {
+        const warn = jest.spyOn(console, "warn").mockImplementation(() => {});
+        const linkDir = join(dir, "links");
+        mkdirSync(linkDir);
+        symlinkSync(
+            join(dir, "does-not-exist.json"),
+            join(linkDir, "fortify.config.json")
+        );
+
+        const config = ConfigLoader.loadConfig({
+            searchPaths: [linkDir, dir],
+        }) as any;
+        expect(config.logging.level).toBe("info");
+        expect(warn).not.toHaveBeenCalled();
+    });
+
+    it("picks up a rewritten config file", () => {
+        const first = ConfigLoader.loadConfig({ searchPaths: [dir] }) as any;
+        expect(first.logging.level).toBe("info");
+
+        writeFileSync(
+            configPath,
+            JSON.stringify({ logging: { enabled: true, level: "error" } })
+        );
+
+        const second = ConfigLoader.loadConfig({ searchPaths: [dir] }) as any;
+        expect(second.logging.level).toBe("error");
+    });
+});
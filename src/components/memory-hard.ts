@@ -193,6 +193,29 @@ export async function argon2Derive(
     }
 }
 
+/**
+ * Cached result of probing for the argon2 command-line tool
+ */
+let argon2CliAvailable: boolean | undefined;
+
+/**
+ * Check whether the argon2 command-line tool is available
+ * The probe spawns a child process, so the result is cached for the process lifetime
+ *
+ * @returns True if `argon2 -h` ran successfully
+ */
+function isArgon2CliAvailable(): boolean {
+    if (argon2CliAvailable === undefined) {
+        try {
+            childProcess.execSync("argon2 -h", { stdio: "ignore" });
+            argon2CliAvailable = true;
+        } catch {
+            argon2CliAvailable = false;
+        }
+    }
+    return argon2CliAvailable;
+}
+
 /**
  * Real implementation of Argon2 for environments where the argon2 library is not available
  * This uses the argon2-browser library or a Node.js child process approach as fallbacks
@@ -604,11 +627,7 @@ function argon2DeriveSimplified(
                 const os = require("os");
 
                 // Check if argon2 command-line tool is available
-                try {
-                    // Try to execute argon2 -h to check if it's available
-                    childProcess.execSync("argon2 -h", { stdio: "ignore" });
-
-                    // If we get here, argon2 is available
+                if (isArgon2CliAvailable()) {
                     console.warn("Using argon2 command-line tool as fallback");
 
                     // Create temporary files for password and salt
@@ -675,9 +694,8 @@ function argon2DeriveSimplified(
                             memoryUsedBytes: memoryCost,
                         },
                     };
-                } catch (e) {
-                    // argon2 command-line tool not available
-                    console.warn("argon2 command-line tool not available:", e);
+                } else {
+                    console.warn("argon2 command-line tool not available");
                 }
             } catch (e) {
                 console.warn("Child process approach failed:", e);
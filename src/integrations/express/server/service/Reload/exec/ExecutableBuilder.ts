@@ -3,7 +3,7 @@
  * Creates standalone executables for different platforms
  */
 
-import { execSync, spawn } from "child_process";
+import { execSync, spawn, StdioOptions } from "child_process";
 import {
     existsSync,
     readFileSync,
@@ -204,7 +204,7 @@ main().catch(error => {
     ): Promise<void> {
         try {
             // Check if esbuild is available
-            execSync("npx esbuild --version", { stdio: "pipe" });
+            execSync("npx esbuild --version", { stdio: "ignore" });
         } catch {
             throw new Error(
                 "esbuild not found. Install with: npm install -D esbuild"
@@ -230,7 +230,7 @@ main().catch(error => {
             .join(" ");
 
         execSync(buildCommand, {
-            stdio: this.config.verbose ? "inherit" : "pipe",
+            stdio: this.getBuildStdio(),
         });
 
         // Create the final executable script
@@ -255,7 +255,7 @@ ${readFileSync(join(this.config.outputDir!, "ts-executor-main.js"), "utf8")}
         outputPath: string
     ): Promise<void> {
         try {
-            execSync("npx pkg --version", { stdio: "pipe" });
+            execSync("npx pkg --version", { stdio: "ignore" });
         } catch {
             throw new Error("pkg not found. Install with: npm install -D pkg");
         }
@@ -272,7 +272,7 @@ ${readFileSync(join(this.config.outputDir!, "ts-executor-main.js"), "utf8")}
         ].join(" ");
 
         execSync(pkgCommand, {
-            stdio: this.config.verbose ? "inherit" : "pipe",
+            stdio: this.getBuildStdio(),
         });
     }
 
@@ -284,7 +284,7 @@ ${readFileSync(join(this.config.outputDir!, "ts-executor-main.js"), "utf8")}
         outputPath: string
     ): Promise<void> {
         try {
-            execSync("npx nexe --version", { stdio: "pipe" });
+            execSync("npx nexe --version", { stdio: "ignore" });
         } catch {
             throw new Error(
                 "nexe not found. Install with: npm install -D nexe"
@@ -303,7 +303,7 @@ ${readFileSync(join(this.config.outputDir!, "ts-executor-main.js"), "utf8")}
         ].join(" ");
 
         execSync(nexeCommand, {
-            stdio: this.config.verbose ? "inherit" : "pipe",
+            stdio: this.getBuildStdio(),
         });
     }
 
@@ -325,7 +325,7 @@ ${readFileSync(join(this.config.outputDir!, "ts-executor-main.js"), "utf8")}
 
         try {
             execSync(`npx webpack --config ${configPath}`, {
-                stdio: this.config.verbose ? "inherit" : "pipe",
+                stdio: this.getBuildStdio(),
             });
         } catch {
             throw new Error(
@@ -334,6 +334,13 @@ ${readFileSync(join(this.config.outputDir!, "ts-executor-main.js"), "utf8")}
         }
     }
 
+    /**
+     * Get stdio for build tool invocations (stdout discarded unless verbose)
+     */
+    private getBuildStdio(): StdioOptions {
+        return this.config.verbose ? "inherit" : ["ignore", "ignore", "pipe"];
+    }
+
     /**
      * Get executable name for platform
      */
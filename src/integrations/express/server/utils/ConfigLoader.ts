@@ -3,7 +3,7 @@
  * Loads configuration from various sources with priority order
  */
 
-import { existsSync, readFileSync } from "fs";
+import { existsSync, readFileSync, readdirSync } from "fs";
 import { join } from "path";
 import type { ServerOptions } from "../../types/types";
 
@@ -13,6 +13,14 @@ export interface ConfigLoaderOptions {
     allowedExtensions?: string[];
 }
 
+/**
+ * Exact and lowercased entry names of a config search directory
+ */
+interface DirectoryEntries {
+    names: Set<string>;
+    lowerNames: Set<string>;
+}
+
 export class ConfigLoader {
     private static readonly DEFAULT_CONFIG_FILES = [
         "fortify.config.js",
@@ -63,19 +71,29 @@ export class ConfigLoader {
             }
         }
 
-        // Search for config files in search paths
+        // Search for config files in search paths (one directory listing per path)
         for (const searchPath of searchPaths) {
+            const entries = ConfigLoader.listDirectory(searchPath);
+            if (entries === undefined) {
+                continue;
+            }
+
             for (const configFileName of ConfigLoader.DEFAULT_CONFIG_FILES) {
-                const configPath = join(searchPath, configFileName);
+                if (
+                    !ConfigLoader.hasConfigFile(
+                        searchPath,
+                        entries,
+                        configFileName
+                    )
+                ) {
+                    continue;
+                }
 
-                if (existsSync(configPath)) {
-                    const config = ConfigLoader.loadConfigFile(configPath);
-                    if (config) {
-                        console.log(
-                            `✔Loaded configuration from: ${configPath}`
-                        );
-                        return config;
-                    }
+                const configPath = join(searchPath, configFileName);
+                const config = ConfigLoader.loadConfigFile(configPath);
+                if (config) {
+                    console.log(`✔Loaded configuration from: ${configPath}`);
+                    return config;
                 }
             }
         }
@@ -83,6 +101,48 @@ export class ConfigLoader {
         return null;
     }
 
+    /**
+     * List directory entries as exact and lowercased name sets, undefined if
+     * the directory does not exist, or null if it exists but cannot be listed
+     * (e.g. execute-only)
+     */
+    private static listDirectory(
+        dirPath: string
+    ): DirectoryEntries | null | undefined {
+        try {
+            const names = readdirSync(dirPath);
+            return {
+                names: new Set(names),
+                lowerNames: new Set(names.map((name) => name.toLowerCase())),
+            };
+        } catch (error: any) {
+            return error.code === "ENOENT" || error.code === "ENOTDIR"
+                ? undefined
+                : null;
+        }
+    }
+
+    /**
+     * Check whether a config file exists in a search path.
+     * Exact matches come from the listing; case-only matches and unlistable
+     * directories defer to existsSync so case-insensitive filesystems behave as before
+     */
+    private static hasConfigFile(
+        searchPath: string,
+        entries: DirectoryEntries | null,
+        fileName: string
+    ): boolean {
+        if (entries === null) {
+            return existsSync(join(searchPath, fileName));
+        }
+
+        return (
+            entries.names.has(fileName) ||
+            (entries.lowerNames.has(fileName.toLowerCase()) &&
+                existsSync(join(searchPath, fileName)))
+        );
+    }
+
     /**
      * Load configuration from a specific file
      */